@@ -1,19 +1,24 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Union, cast
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Union, cast
 
-from deprecation import deprecated
 from httpx import Headers, QueryParams, Timeout
 
-from .. import __version__
 from ..base_client import BasePostgrestClient
+from ..base_request_builder import APIResponse
 from ..constants import (
     DEFAULT_POSTGREST_CLIENT_HEADERS,
     DEFAULT_POSTGREST_CLIENT_TIMEOUT,
 )
 from ..types import CountMethod
-from ..utils import AsyncClient
-from .request_builder import AsyncRequestBuilder, AsyncRPCFilterRequestBuilder
+from ..utils import AsyncClient, AsyncExecutor
+from .request_builder import (
+    AsyncQueryRequestBuilder,
+    AsyncRequestBuilder,
+    AsyncRPCFilterRequestBuilder,
+    AsyncSingleRequestBuilder,
+)
 
 _TableT = Dict[str, Any]
 
@@ -29,6 +34,8 @@ class AsyncPostgrestClient(BasePostgrestClient):
         headers: Dict[str, str] = DEFAULT_POSTGREST_CLIENT_HEADERS,
         timeout: Union[int, float, Timeout] = DEFAULT_POSTGREST_CLIENT_TIMEOUT,
         verify: bool = True,
+        http2: bool = True,
+        use_orjson: bool = False,
     ) -> None:
         BasePostgrestClient.__init__(
             self,
@@ -37,15 +44,18 @@ class AsyncPostgrestClient(BasePostgrestClient):
             headers=headers,
             timeout=timeout,
             verify=verify,
+            http2=http2,
+            use_orjson=use_orjson,
         )
         self.session = cast(AsyncClient, self.session)
 
     def create_session(
         self,
         base_url: str,
-        headers: Dict[str, str],
+        headers: Headers,
         timeout: Union[int, float, Timeout],
         verify: bool = True,
+        http2: bool = True,
     ) -> AsyncClient:
         return AsyncClient(
             base_url=base_url,
@@ -53,7 +63,7 @@ class AsyncPostgrestClient(BasePostgrestClient):
             timeout=timeout,
             verify=verify,
             follow_redirects=True,
-            http2=True,
+            http2=http2,
         )
 
     async def __aenter__(self) -> AsyncPostgrestClient:
@@ -74,15 +84,24 @@ class AsyncPostgrestClient(BasePostgrestClient):
         Returns:
             :class:`AsyncRequestBuilder`
         """
-        return AsyncRequestBuilder[_TableT](self.session, f"/{table}")
+        return AsyncRequestBuilder[_TableT](self.session, "/" + table)
 
     def table(self, table: str) -> AsyncRequestBuilder[_TableT]:
         """Alias to :meth:`from_`."""
         return self.from_(table)
 
-    @deprecated("0.2.0", "1.0.0", __version__, "Use self.from_() instead")
     def from_table(self, table: str) -> AsyncRequestBuilder:
-        """Alias to :meth:`from_`."""
+        """Alias to :meth:`from_`.
+
+        .. deprecated:: 0.2.0
+            Use :meth:`from_` instead.
+        """
+        warnings.warn(
+            "from_table is deprecated as of 0.2.0 and will be removed in 1.0.0. "
+            "Use self.from_() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         return self.from_(table)
 
     def rpc(
@@ -120,5 +139,26 @@ class AsyncPostgrestClient(BasePostgrestClient):
 
         # the params here are params to be sent to the RPC and not the queryparams!
         return AsyncRPCFilterRequestBuilder[Any](
-            self.session, f"/rpc/{func}", method, headers, QueryParams(), json=params
+            self.session, "/rpc/" + func, method, headers, QueryParams(), json=params
         )
+
+    async def execute_many(
+        self,
+        builders: Iterable[
+            Union[AsyncQueryRequestBuilder[Any], AsyncSingleRequestBuilder[Any]]
+        ],
+    ) -> List[Optional[APIResponse[Any]]]:
+        """Execute several independent queries concurrently.
+
+        The requests share the client's session, so over HTTP/2 they are
+        multiplexed on a single connection. If one of them fails, the others
+        are cancelled.
+
+        Args:
+            builders: The fully built queries to execute.
+        Returns:
+            The result of each query's :meth:`execute`, in the order of `builders`.
+        Raises:
+            :class:`APIError` If any of the queries raised an error.
+        """
+        return await AsyncExecutor.execute_all(list(builders))
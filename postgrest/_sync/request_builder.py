@@ -25,8 +25,15 @@ from ..utils import SyncClient, get_origin_and_cast
 
 _ReturnT = TypeVar("_ReturnT")
 
+# parametrizing a pydantic model is a cache lookup on every call,
+# so do it once here instead of in every execute()
+_APIResponse = APIResponse[_ReturnT]
+_SingleAPIResponse = SingleAPIResponse[_ReturnT]
+
 
 class SyncQueryRequestBuilder(Generic[_ReturnT]):
+    __slots__ = ("session", "path", "http_method", "headers", "params", "json")
+
     def __init__(
         self,
         session: SyncClient,
@@ -65,15 +72,15 @@ class SyncQueryRequestBuilder(Generic[_ReturnT]):
         try:
             if r.is_success:
                 if self.http_method != "HEAD":
-                    body = r.text
-                    if self.headers.get("Accept") == "text/csv":
-                        return body
-                    if self.headers.get(
-                        "Accept"
-                    ) and "application/vnd.pgrst.plan" in self.headers.get("Accept"):
-                        if "+json" not in self.headers.get("Accept"):
-                            return body
-                return APIResponse[_ReturnT].from_http_request_response(r)
+                    accept = self.headers.get("Accept")
+                    if accept == "text/csv":
+                        return r.text
+                    if accept and "application/vnd.pgrst.plan" in accept:
+                        if "+json" not in accept:
+                            return r.text
+                # sessions not created by a PostgrestClient have no use_orjson
+                use_orjson = getattr(self.session, "use_orjson", False)
+                return _APIResponse.from_http_request_response(r, use_orjson)
             else:
                 raise APIError(r.json())
         except ValidationError as e:
@@ -83,6 +90,8 @@ class SyncQueryRequestBuilder(Generic[_ReturnT]):
 
 
 class SyncSingleRequestBuilder(Generic[_ReturnT]):
+    __slots__ = ("session", "path", "http_method", "headers", "params", "json")
+
     def __init__(
         self,
         session: SyncClient,
@@ -119,10 +128,11 @@ class SyncSingleRequestBuilder(Generic[_ReturnT]):
             headers=self.headers,
         )
         try:
-            if (
-                200 <= r.status_code <= 299
-            ):  # Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
-                return SingleAPIResponse[_ReturnT].from_http_request_response(r)
+            # same range as Response.ok from JS (https://developer.mozilla.org/en-US/docs/Web/API/Response/ok)
+            if r.is_success:
+                # sessions not created by a PostgrestClient have no use_orjson
+                use_orjson = getattr(self.session, "use_orjson", False)
+                return _SingleAPIResponse.from_http_request_response(r, use_orjson)
             else:
                 raise APIError(r.json())
         except ValidationError as e:
@@ -132,11 +142,15 @@ class SyncSingleRequestBuilder(Generic[_ReturnT]):
 
 
 class SyncMaybeSingleRequestBuilder(SyncSingleRequestBuilder[_ReturnT]):
+    __slots__ = ()
+
     def execute(self) -> Optional[SingleAPIResponse[_ReturnT]]:
         r = None
         try:
-            r = SyncSingleRequestBuilder[_ReturnT].execute(self)
+            r = super().execute()
         except APIError as e:
+            # PGRST116 is also returned for more than one row, so the
+            # details are what identifies an empty result
             if e.details and "The result contains 0 rows" in e.details:
                 return None
         if not r:
@@ -153,6 +167,8 @@ class SyncMaybeSingleRequestBuilder(SyncSingleRequestBuilder[_ReturnT]):
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncFilterRequestBuilder(BaseFilterRequestBuilder[_ReturnT], SyncQueryRequestBuilder[_ReturnT]):  # type: ignore
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -162,18 +178,18 @@ class SyncFilterRequestBuilder(BaseFilterRequestBuilder[_ReturnT], SyncQueryRequ
         params: QueryParams,
         json: dict,
     ) -> None:
-        get_origin_and_cast(BaseFilterRequestBuilder[_ReturnT]).__init__(
-            self, session, headers, params
-        )
         get_origin_and_cast(SyncQueryRequestBuilder[_ReturnT]).__init__(
             self, session, path, http_method, headers, params, json
         )
+        self._init_filter()
 
 
 # this exists for type-safety. see https://gist.github.com/anand2312/93d3abf401335fd3310d9e30112303bf
 class SyncRPCFilterRequestBuilder(
     BaseRPCRequestBuilder[_ReturnT], SyncSingleRequestBuilder[_ReturnT]
 ):
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -183,16 +199,16 @@ class SyncRPCFilterRequestBuilder(
         params: QueryParams,
         json: dict,
     ) -> None:
-        get_origin_and_cast(BaseFilterRequestBuilder[_ReturnT]).__init__(
-            self, session, headers, params
-        )
         get_origin_and_cast(SyncSingleRequestBuilder[_ReturnT]).__init__(
             self, session, path, http_method, headers, params, json
         )
+        self._init_filter()
 
 
 # ignoring type checking as a workaround for https://github.com/python/mypy/issues/9319
 class SyncSelectRequestBuilder(BaseSelectRequestBuilder[_ReturnT], SyncQueryRequestBuilder[_ReturnT]):  # type: ignore
+    __slots__ = ("negate_next",)
+
     def __init__(
         self,
         session: SyncClient,
@@ -202,12 +218,10 @@ class SyncSelectRequestBuilder(BaseSelectRequestBuilder[_ReturnT], SyncQueryRequ
         params: QueryParams,
         json: dict,
     ) -> None:
-        get_origin_and_cast(BaseSelectRequestBuilder[_ReturnT]).__init__(
-            self, session, headers, params
-        )
         get_origin_and_cast(SyncQueryRequestBuilder[_ReturnT]).__init__(
             self, session, path, http_method, headers, params, json
         )
+        self._init_filter()
 
     def single(self) -> SyncSingleRequestBuilder[_ReturnT]:
         """Specify that the query will only return a single row in response.
@@ -3,9 +3,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, Union
 
-from httpx import BasicAuth, Timeout
+from httpx import BasicAuth, Headers, Timeout
 
-from .utils import AsyncClient, SyncClient
+from .utils import AsyncClient, SyncClient, orjson
 
 
 class BasePostgrestClient(ABC):
@@ -19,21 +19,33 @@ class BasePostgrestClient(ABC):
         headers: Dict[str, str],
         timeout: Union[int, float, Timeout],
         verify: bool = True,
+        http2: bool = True,
+        use_orjson: bool = False,
     ) -> None:
-        headers = {
-            **headers,
-            "Accept-Profile": schema,
-            "Content-Profile": schema,
-        }
-        self.session = self.create_session(base_url, headers, timeout, verify)
+        # Headers replaces keys case-insensitively, so a profile header passed
+        # in by the caller is overridden instead of being sent twice
+        session_headers = Headers(headers)
+        session_headers["Accept-Profile"] = schema
+        session_headers["Content-Profile"] = schema
+        self.session = self.create_session(
+            base_url, session_headers, timeout, verify, http2=http2
+        )
+        if use_orjson:
+            if orjson is None:
+                raise ImportError(
+                    "use_orjson requires orjson, "
+                    "install it with `pip install postgrest[orjson]`"
+                )
+            self.session.use_orjson = True
 
     @abstractmethod
     def create_session(
         self,
         base_url: str,
-        headers: Dict[str, str],
+        headers: Headers,
         timeout: Union[int, float, Timeout],
         verify: bool = True,
+        http2: bool = True,
     ) -> Union[SyncClient, AsyncClient]:
         raise NotImplementedError()
 
@@ -54,7 +66,7 @@ class BasePostgrestClient(ABC):
             Bearer token is preferred if both ones are provided.
         """
         if token:
-            self.session.headers["Authorization"] = f"Bearer {token}"
+            self.session.headers["Authorization"] = "Bearer " + token
         elif username:
             self.session.auth = BasicAuth(username, password)
         else:
@@ -65,10 +77,7 @@ class BasePostgrestClient(ABC):
 
     def schema(self, schema: str):
         """Switch to another schema."""
-        self.session.headers.update(
-            {
-                "Accept-Profile": schema,
-                "Content-Profile": schema,
-            }
-        )
+        headers = self.session.headers
+        headers["Accept-Profile"] = schema
+        headers["Content-Profile"] = schema
         return self
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from json import JSONDecodeError
 from re import search
 from typing import (
@@ -35,7 +36,7 @@ except ImportError:
     from pydantic import validator as field_validator
 
 from .types import CountMethod, Filters, RequestMethod, ReturnMethod
-from .utils import AsyncClient, SyncClient, get_origin_and_cast, sanitize_param
+from .utils import AsyncClient, SyncClient, load_json, sanitize_param
 
 
 class QueryArgs(NamedTuple):
@@ -46,23 +47,56 @@ class QueryArgs(NamedTuple):
     json: Dict[Any, Any]
 
 
-def _unique_columns(json: List[Dict]):
+def _unique_columns(json: List[Dict]) -> str:
     unique_keys = {key for row in json for key in row.keys()}
     columns = ",".join([f'"{k}"' for k in unique_keys])
     return columns
 
 
+# QueryParams are immutable (add/merge return copies), so the empty
+# instance can be shared by every builder that starts without params
+_EMPTY_PARAMS = QueryParams()
+
+
+@lru_cache(maxsize=512)
+def _select_params(columns: Tuple[str, ...]) -> QueryParams:
+    # selects tend to repeat the same column lists, and the QueryParams
+    # built from them are immutable, so they can be shared between builders
+    return QueryParams({"select": ",".join(columns)})
+
+
+@lru_cache(maxsize=256)
+def _prefer_header(
+    returning: Optional[ReturnMethod],
+    count: Optional[CountMethod],
+    resolution: Optional[str] = None,
+    default_to_null: bool = True,
+) -> str:
+    # the Prefer header only depends on these (hashable) arguments,
+    # so it is built once per call shape and reused afterwards
+    prefer_headers = []
+    if returning:
+        prefer_headers.append(f"return={returning}")
+    if count:
+        prefer_headers.append(f"count={count}")
+    if resolution:
+        prefer_headers.append(f"resolution={resolution}-duplicates")
+    if not default_to_null:
+        prefer_headers.append("missing=default")
+    return ",".join(prefer_headers)
+
+
 def pre_select(
     *columns: str,
     count: Optional[CountMethod] = None,
 ) -> QueryArgs:
     if columns:
         method = RequestMethod.GET
-        params = QueryParams({"select": ",".join(columns)})
+        params = _select_params(columns)
     else:
         method = RequestMethod.HEAD
-        params = QueryParams()
-    headers = Headers({"Prefer": f"count={count}"}) if count else Headers()
+        params = _EMPTY_PARAMS
+    headers = Headers({"Prefer": _prefer_header(None, count)}) if count else Headers()
     return QueryArgs(method, params, headers, {})
 
 
@@ -74,19 +108,15 @@ def pre_insert(
     upsert: bool,
     default_to_null: bool = True,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    if upsert:
-        prefer_headers.append("resolution=merge-duplicates")
-    if not default_to_null:
-        prefer_headers.append("missing=default")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
+    resolution = "merge" if upsert else None
+    headers = Headers(
+        {"Prefer": _prefer_header(returning, count, resolution, default_to_null)}
+    )
     # Adding 'columns' query parameters
-    query_params = {}
+    params = _EMPTY_PARAMS
     if isinstance(json, list):
-        query_params = {"columns": _unique_columns(json)}
-    return QueryArgs(RequestMethod.POST, QueryParams(query_params), headers, json)
+        params = QueryParams({"columns": _unique_columns(json)})
+    return QueryArgs(RequestMethod.POST, params, headers, json)
 
 
 def pre_upsert(
@@ -99,20 +129,17 @@ def pre_upsert(
     default_to_null: bool = True,
 ) -> QueryArgs:
     query_params = {}
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
     resolution = "ignore" if ignore_duplicates else "merge"
-    prefer_headers.append(f"resolution={resolution}-duplicates")
-    if not default_to_null:
-        prefer_headers.append("missing=default")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
+    headers = Headers(
+        {"Prefer": _prefer_header(returning, count, resolution, default_to_null)}
+    )
     if on_conflict:
         query_params["on_conflict"] = on_conflict
     # Adding 'columns' query parameters
     if isinstance(json, list):
         query_params["columns"] = _unique_columns(json)
-    return QueryArgs(RequestMethod.POST, QueryParams(query_params), headers, json)
+    params = QueryParams(query_params) if query_params else _EMPTY_PARAMS
+    return QueryArgs(RequestMethod.POST, params, headers, json)
 
 
 def pre_update(
@@ -121,11 +148,8 @@ def pre_update(
     count: Optional[CountMethod],
     returning: ReturnMethod,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
-    return QueryArgs(RequestMethod.PATCH, QueryParams(), headers, json)
+    headers = Headers({"Prefer": _prefer_header(returning, count)})
+    return QueryArgs(RequestMethod.PATCH, _EMPTY_PARAMS, headers, json)
 
 
 def pre_delete(
@@ -133,15 +157,15 @@ def pre_delete(
     count: Optional[CountMethod],
     returning: ReturnMethod,
 ) -> QueryArgs:
-    prefer_headers = [f"return={returning}"]
-    if count:
-        prefer_headers.append(f"count={count}")
-    headers = Headers({"Prefer": ",".join(prefer_headers)})
-    return QueryArgs(RequestMethod.DELETE, QueryParams(), headers, {})
+    headers = Headers({"Prefer": _prefer_header(returning, count)})
+    return QueryArgs(RequestMethod.DELETE, _EMPTY_PARAMS, headers, {})
 
 
 _ReturnT = TypeVar("_ReturnT")
 
+# built once from the enum members instead of on every response
+_COUNT_IN_PREFER_PATTERN = f"count=({'|'.join([cm.value for cm in CountMethod])})"
+
 
 # the APIResponse.data is marked as _ReturnT instead of list[_ReturnT]
 # as it is also returned in the case of rpc() calls; and rpc calls do not
@@ -169,8 +193,7 @@ class APIResponse(BaseModel, Generic[_ReturnT]):
 
     @staticmethod
     def _is_count_in_prefer_header(prefer_header: str) -> bool:
-        pattern = f"count=({'|'.join([cm.value for cm in CountMethod])})"
-        return bool(search(pattern, prefer_header))
+        return bool(search(_COUNT_IN_PREFER_PATTERN, prefer_header))
 
     @classmethod
     def _get_count_from_http_request_response(
@@ -192,10 +215,10 @@ class APIResponse(BaseModel, Generic[_ReturnT]):
 
     @classmethod
     def from_http_request_response(
-        cls: Type[Self], request_response: RequestResponse
+        cls: Type[Self], request_response: RequestResponse, use_orjson: bool = False
     ) -> Self:
         try:
-            data = request_response.json()
+            data = load_json(request_response, use_orjson)
         except JSONDecodeError:
             return cls(data=[], count=0)
         count = cls._get_count_from_http_request_response(request_response)
@@ -218,11 +241,11 @@ class SingleAPIResponse(APIResponse[_ReturnT], Generic[_ReturnT]):
 
     @classmethod
     def from_http_request_response(
-        cls: Type[Self], request_response: RequestResponse
+        cls: Type[Self], request_response: RequestResponse, use_orjson: bool = False
     ) -> Self:
         count = cls._get_count_from_http_request_response(request_response)
         try:
-            data = request_response.json()
+            data = load_json(request_response, use_orjson)
         except JSONDecodeError:
             data = request_response.text if len(request_response.text) > 0 else []
         return cls[_ReturnT](data=data, count=count)  # type: ignore
@@ -237,15 +260,18 @@ class SingleAPIResponse(APIResponse[_ReturnT], Generic[_ReturnT]):
 
 
 class BaseFilterRequestBuilder(Generic[_ReturnT]):
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        self.session = session
-        self.headers = headers
-        self.params = params
+    # the attributes live in the __slots__ of the concrete request builders
+    # this is mixed into (see _async/request_builder.py and _sync/request_builder.py)
+    __slots__ = ()
+
+    session: Union[AsyncClient, SyncClient]
+    headers: Headers
+    params: QueryParams
+    negate_next: bool
+
+    def _init_filter(self) -> None:
+        # called by the concrete request builders once session, headers
+        # and params are set
         self.negate_next = False
 
     @property
@@ -512,18 +538,7 @@ class BaseFilterRequestBuilder(Generic[_ReturnT]):
 
 
 class BaseSelectRequestBuilder(BaseFilterRequestBuilder[_ReturnT]):
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        # Generic[T] is an instance of typing._GenericAlias, so doing Generic[T].__init__
-        # tries to call _GenericAlias.__init__ - which is the wrong method
-        # The __origin__ attribute of the _GenericAlias is the actual class
-        get_origin_and_cast(BaseFilterRequestBuilder[_ReturnT]).__init__(
-            self, session, headers, params
-        )
+    __slots__ = ()
 
     def explain(
         self: Self,
@@ -609,18 +624,7 @@ class BaseSelectRequestBuilder(BaseFilterRequestBuilder[_ReturnT]):
 
 
 class BaseRPCRequestBuilder(BaseSelectRequestBuilder[_ReturnT]):
-    def __init__(
-        self,
-        session: Union[AsyncClient, SyncClient],
-        headers: Headers,
-        params: QueryParams,
-    ) -> None:
-        # Generic[T] is an instance of typing._GenericAlias, so doing Generic[T].__init__
-        # tries to call _GenericAlias.__init__ - which is the wrong method
-        # The __origin__ attribute of the _GenericAlias is the actual class
-        get_origin_and_cast(BaseSelectRequestBuilder[_ReturnT]).__init__(
-            self, session, headers, params
-        )
+    __slots__ = ()
 
     def select(
         self,
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-from deprecation import deprecated
+import warnings
 
-from . import __version__
 from ._async.client import AsyncPostgrestClient
 
 
 class Client(AsyncPostgrestClient):
     """Alias to PostgrestClient."""
 
-    @deprecated("0.2.0", "1.0.0", __version__, "Use PostgrestClient instead")
     def __init__(self, *args, **kwargs):
+        warnings.warn(
+            "Client is deprecated as of 0.2.0 and will be removed in 1.0.0. "
+            "Use PostgrestClient instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         super().__init__(*args, **kwargs)
 
 
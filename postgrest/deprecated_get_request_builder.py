@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from deprecation import deprecated
+import warnings
 
-from . import __version__
 from ._async.request_builder import AsyncSelectRequestBuilder
 
 
 class GetRequestBuilder(AsyncSelectRequestBuilder):
     """Alias to SelectRequestBuilder."""
 
-    @deprecated("0.4.0", "1.0.0", __version__, "Use SelectRequestBuilder instead")
     def __init__(self, *args, **kwargs):
+        warnings.warn(
+            "GetRequestBuilder is deprecated as of 0.4.0 and will be removed "
+            "in 1.0.0. Use SelectRequestBuilder instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         super().__init__(*args, **kwargs)
@@ -1,16 +1,91 @@
 from __future__ import annotations
 
-from typing import Any, Type, TypeVar, cast, get_origin
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Type, TypeVar, cast, get_origin
 
-from httpx import AsyncClient  # noqa: F401
-from httpx import Client as BaseClient  # noqa: F401
+from httpx import AsyncClient as BaseAsyncClient
+from httpx import Client as BaseClient
+from httpx import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class AsyncClient(BaseAsyncClient):
+    use_orjson: bool = False
+    """Whether response bodies are decoded with orjson, see :func:`load_json`."""
 
 
 class SyncClient(BaseClient):
+    use_orjson: bool = False
+    """Whether response bodies are decoded with orjson, see :func:`load_json`."""
+
     def aclose(self) -> None:
         self.close()
 
 
+# upper bound on the worker threads used by SyncExecutor
+_MAX_CONCURRENT_QUERIES = 10
+
+
+class AsyncExecutor:
+    @staticmethod
+    async def execute_all(builders: List[Any]) -> List[Any]:
+        """Run `execute()` on every builder concurrently, keeping their order.
+
+        If one of them fails, the others are cancelled before the error is raised.
+        """
+        tasks = [asyncio.ensure_future(builder.execute()) for builder in builders]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+class SyncExecutor:
+    @staticmethod
+    def execute_all(builders: List[Any]) -> List[Any]:
+        """Run `execute()` on every builder in a thread pool, keeping their order.
+
+        If one of them fails, the ones that have not started yet are cancelled
+        before the error is raised.
+        """
+        if not builders:
+            return []
+        max_workers = min(len(builders), _MAX_CONCURRENT_QUERIES)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(builder.execute) for builder in builders]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+
+def load_json(response: Response, use_orjson: bool = False) -> Any:
+    """Decode the JSON body of a response.
+
+    By default this is :meth:`httpx.Response.json`. With `use_orjson`, UTF-8
+    bodies are decoded with orjson instead, which is faster but turns integers
+    wider than 64 bits (e.g. from `numeric` columns) into floats.
+
+    Raises:
+        `json.JSONDecodeError`: If the body is not valid JSON.
+    """
+    charset = response.charset_encoding
+    if use_orjson and (charset is None or charset.lower() in ("utf-8", "utf8")):
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def sanitize_param(param: Any) -> str:
     param_str = str(param)
     reserved_chars = ",:()"
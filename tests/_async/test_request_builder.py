@@ -1,10 +1,12 @@
 from typing import Any, Dict, List
+from unittest.mock import patch
 
 import pytest
 from httpx import Request, Response
 
 from postgrest import AsyncRequestBuilder, AsyncSingleRequestBuilder
 from postgrest.base_request_builder import APIResponse, SingleAPIResponse
+from postgrest.exceptions import APIError
 from postgrest.types import CountMethod
 from postgrest.utils import AsyncClient
 
@@ -36,6 +38,21 @@ class TestSelect:
         assert builder.http_method == "HEAD"
         assert builder.json == {}
 
+    def test_select_filters_do_not_leak(self, request_builder: AsyncRequestBuilder):
+        request_builder.select("col1", "col2").eq("col1", 1)
+        builder = request_builder.select("col1", "col2")
+
+        assert str(builder.params) == "select=col1%2Ccol2"
+
+    def test_select_with_count_does_not_share_headers(
+        self, request_builder: AsyncRequestBuilder
+    ):
+        first = request_builder.select(count=CountMethod.exact)
+        second = request_builder.select(count=CountMethod.exact)
+        first.headers["prefer"] = "count=planned"
+
+        assert second.headers["prefer"] == "count=exact"
+
     def test_select_as_csv(self, request_builder: AsyncRequestBuilder):
         builder = request_builder.select("*").csv()
 
@@ -159,6 +176,12 @@ class TestDelete:
         assert builder.http_method == "DELETE"
         assert builder.json == {}
 
+    def test_delete_filters_do_not_leak(self, request_builder: AsyncRequestBuilder):
+        request_builder.delete().eq("id", 1)
+        builder = request_builder.delete()
+
+        assert str(builder.params) == ""
+
 
 class TestTextSearch:
     def test_text_search(self, request_builder: AsyncRequestBuilder):
@@ -190,6 +213,39 @@ class TestExplain:
         assert "options=analyze|verbose|buffers|wal" in str(builder.headers.get("accept"))
 
 
+class TestMaybeSingle:
+    # PostgREST answers both "no rows" and "more than one row" with PGRST116,
+    # only the details tell them apart
+    async def test_maybe_single_without_rows(self, request_builder: AsyncRequestBuilder):
+        error = APIError(
+            {
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "hint": None,
+                "details": "The result contains 0 rows",
+            }
+        )
+        with patch.object(AsyncSingleRequestBuilder, "execute", side_effect=error):
+            builder = request_builder.select("*").maybe_single()
+            assert await builder.execute() is None
+
+    async def test_maybe_single_with_multiple_rows(
+        self, request_builder: AsyncRequestBuilder
+    ):
+        error = APIError(
+            {
+                "message": "JSON object requested, multiple (or no) rows returned",
+                "code": "PGRST116",
+                "hint": None,
+                "details": "The result contains 2 rows",
+            }
+        )
+        with patch.object(AsyncSingleRequestBuilder, "execute", side_effect=error):
+            builder = request_builder.select("*").maybe_single()
+            with pytest.raises(APIError):
+                await builder.execute()
+
+
 class TestRange:
     def test_range_on_own_table(self, request_builder: AsyncRequestBuilder):
         builder = request_builder.select("*").range(0, 1)
@@ -3,8 +3,9 @@ from unittest.mock import patch
 import pytest
 from httpx import BasicAuth, Headers
 
-from postgrest import SyncPostgrestClient
+from postgrest import SyncPostgrestClient, SyncQueryRequestBuilder
 from postgrest.exceptions import APIError
+from postgrest.utils import SyncClient
 
 
 @pytest.fixture
@@ -44,6 +45,34 @@ class TestConstructor:
             )
             assert session.headers.items() >= headers.items()
 
+    def test_schema_overrides_profile_headers(self):
+        with SyncPostgrestClient(
+            "https://example.com",
+            schema="pub",
+            headers={"accept-profile": "other", "content-profile": "other"},
+        ) as client:
+            headers = client.session.headers
+
+            assert headers.get_list("accept-profile") == ["pub"]
+            assert headers.get_list("content-profile") == ["pub"]
+
+    def test_http2_disabled(self):
+        with patch.object(SyncClient, "__init__", return_value=None) as client_init:
+            SyncPostgrestClient("https://example.com", http2=False)
+
+        assert client_init.call_args.kwargs["http2"] is False
+
+    def test_use_orjson(self):
+        pytest.importorskip("orjson")
+        client = SyncPostgrestClient("https://example.com", use_orjson=True)
+
+        assert client.session.use_orjson is True
+
+    def test_use_orjson_without_orjson(self):
+        with patch("postgrest.base_client.orjson", None):
+            with pytest.raises(ImportError):
+                SyncPostgrestClient("https://example.com", use_orjson=True)
+
 
 class TestAuth:
     def test_auth_token(self, postgrest_client: SyncPostgrestClient):
@@ -71,6 +100,12 @@ def test_schema(postgrest_client: SyncPostgrestClient):
     assert subheaders.items() < dict(session.headers).items()
 
 
+def test_from_table_is_deprecated(postgrest_client: SyncPostgrestClient):
+    with pytest.warns(DeprecationWarning):
+        builder = postgrest_client.from_table("test")
+    assert builder.path == "/test"
+
+
 def test_params_purged_after_execute(postgrest_client: SyncPostgrestClient):
     assert len(postgrest_client.session.params) == 0
     with pytest.raises(APIError):
@@ -111,3 +146,36 @@ def test_response_maybe_single(postgrest_client: SyncPostgrestClient):
         exc_response = exc_info.value.json()
         assert isinstance(exc_response.get("message"), str)
         assert "code" in exc_response and int(exc_response["code"]) == 204
+
+
+def test_execute_many_keeps_order(postgrest_client: SyncPostgrestClient):
+    with patch.object(
+        SyncQueryRequestBuilder,
+        "execute",
+        autospec=True,
+        side_effect=lambda builder: builder.path,
+    ):
+        results = postgrest_client.execute_many(
+            [
+                postgrest_client.from_("countries").select("*"),
+                postgrest_client.from_("cities").insert({"name": "Oslo"}),
+                postgrest_client.from_("users").select("id").eq("id", 1),
+            ]
+        )
+    assert results == ["/countries", "/cities", "/users"]
+
+
+def test_execute_many_raises_api_error(postgrest_client: SyncPostgrestClient):
+    with patch.object(
+        SyncQueryRequestBuilder,
+        "execute",
+        side_effect=APIError({"message": "mock error", "code": "400"}),
+    ):
+        with pytest.raises(APIError):
+            postgrest_client.execute_many(
+                [postgrest_client.from_("countries").select("*")]
+            )
+
+
+def test_execute_many_without_queries(postgrest_client: SyncPostgrestClient):
+    assert postgrest_client.execute_many([]) == []
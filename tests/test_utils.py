@@ -1,6 +1,11 @@
+import asyncio
+from json import JSONDecodeError
+
 import pytest
+from httpx import Response
 
-from postgrest.utils import sanitize_param
+from postgrest.exceptions import APIError
+from postgrest.utils import AsyncExecutor, load_json, sanitize_param
 
 
 @pytest.mark.parametrize(
@@ -17,3 +22,59 @@ from postgrest.utils import sanitize_param
 )
 def test_sanitize_params(value, expected):
     assert sanitize_param(value) == expected
+
+
+def test_load_json():
+    response = Response(200, content=b'[{"id": 1, "name": "\xc3\xa9"}]')
+    assert load_json(response) == [{"id": 1, "name": "é"}]
+
+
+def test_load_json_keeps_wide_integers():
+    response = Response(200, content=b'[{"n": 123456789012345678901234567890}]')
+    assert load_json(response) == [{"n": 123456789012345678901234567890}]
+
+
+def test_load_json_with_orjson():
+    pytest.importorskip("orjson")
+    response = Response(200, content=b'[{"id": 1, "name": "\xc3\xa9"}]')
+    assert load_json(response, use_orjson=True) == [{"id": 1, "name": "é"}]
+
+
+def test_load_json_with_orjson_respects_charset():
+    pytest.importorskip("orjson")
+    # orjson only reads UTF-8, other charsets go through Response.json()
+    response = Response(
+        200,
+        content='["é"]'.encode("utf-16"),
+        headers={"Content-Type": "application/json; charset=utf-16"},
+    )
+    assert load_json(response, use_orjson=True) == ["é"]
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_load_json_invalid_body(use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    with pytest.raises(JSONDecodeError):
+        load_json(Response(200, content=b""), use_orjson=use_orjson)
+
+
+@pytest.mark.asyncio
+async def test_async_executor_cancels_remaining_queries_on_failure():
+    cancelled = asyncio.Event()
+
+    class SlowQuery:
+        async def execute(self):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    class FailingQuery:
+        async def execute(self):
+            raise APIError({"message": "mock error", "code": "400"})
+
+    with pytest.raises(APIError):
+        await AsyncExecutor.execute_all([SlowQuery(), FailingQuery()])
+    assert cancelled.is_set()